@@ -152,8 +152,8 @@ def generate_person_dict(
     return pdict
 
 
-def _parse_args() -> argparse.Namespace:
-    """Parses command line arguments."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Builds the command line argument parser."""
     parser = argparse.ArgumentParser(
         description="Generate random person data.",
         formatter_class=argparse.RawTextHelpFormatter
@@ -188,18 +188,27 @@ def _parse_args() -> argparse.Namespace:
         help="Output format: 'oneline' or 'table' (default: 'oneline')."
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parses command line arguments."""
+    return _build_parser().parse_args()
 
 
 def _validate_args(args: argparse.Namespace) -> None:
     """Validates parsed arguments."""
+    error_message = None
     if args.count <= 0:
-        # Use parser.error for graceful exit with help message
-        argparse.ArgumentParser().error("Count must be a positive integer.")
-    if args.min_age > args.max_age:
-        argparse.ArgumentParser().error("Minimum age cannot be greater than maximum age.")
-    if args.min_age < 0:
-        argparse.ArgumentParser().error("Minimum age cannot be less than zero.")
+        error_message = "Count must be a positive integer."
+    elif args.min_age > args.max_age:
+        error_message = "Minimum age cannot be greater than maximum age."
+    elif args.min_age < 0:
+        error_message = "Minimum age cannot be less than zero."
+
+    if error_message is not None:
+        # Only build the real parser on failure, so the exit shows its usage line
+        _build_parser().error(error_message)
 
 
 def _generate_people_list(args: argparse.Namespace) -> List[Dict[str, Any]]:
@@ -9,6 +9,12 @@ This conftest.py file serves as a central place to:
   like `_read_and_process_all_lines_from_file` and specific generators.
 - Declare test-specific `Path` constants (e.g., `DATA_EMPTY_PATH`)
   that point to mock or edge-case data files used during testing.
+- Provide shared fixtures. Read-only data such as `mock_person_dict` is
+  session-scoped so it is built once rather than per test; fixtures that
+  patch something (`patched_open`, `read_files_stub`) stay
+  function-scoped so every patch is undone after its test.
+- Parametrize selected tests lazily through `pytest_generate_tests`,
+  building their cases only when those tests are collected.
 - Import necessary modules and constants that are frequently used across tests,
   promoting consistency.
 
@@ -16,9 +22,13 @@ The definitions within this file are automatically discovered by pytest and
 can be imported into test modules to facilitate cleaner and more maintainable
 test suites.
 """
+import argparse
+import builtins
+from dataclasses import dataclass
+import io
 from pathlib import Path
-import textwrap
-from typing import Any # Import Any for more generic dict typing
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Callable, Iterator, Optional # Import Any for more generic dict typing
 import pytest
 
 # Import the actual path constants
@@ -29,136 +39,402 @@ from person_generator.random_person_generator import (
     GEN_MALE_PATH,
     GEN_FEMALE_PATH,
     SURNAME_PATH,
-    JOBS_PATH
+    JOBS_PATH,
+    DEFAULT_MIN_AGE,
+    DEFAULT_MAX_AGE
 )
 DATA_EMPTY_PATH: Path = get_data_file("empty.txt")
 DATA_NUMBERS_ONLY_PATH: Path = get_data_file("numbers_only.txt")
 
+# Fake file contents fed to the patched builtins.open, written out as plain
+# literals in the same fixed-width layout as the real data files.
+MOCK_MALE_NAME_FILE_DATA: str = "JAMES          3.318  3.318         1\n"
+MOCK_FEMALE_NAME_FILE_DATA: str = "MARY           2.629  2.629         1\n"
+MOCK_SURNAME_FILE_DATA: str = "SMITH          1.006  1.006         1\n"
+MOCK_JOB_FILE_DATA: str = "Doctor\n"
+
 # Relates to pytests/test_random_person_generator_pytest.py
-    # @pytest.mark.parametrize(
-    #     "mock_file_content, file_path_arg, regex_pattern, transform_func, expected_outcome",
-    #     TEST_READ_FILE_VARIOUS_INPUTS_CASES
-    # )
-    # def test_read_files_various_inputs(
-TEST_READ_FILE_VARIOUS_INPUTS_CASES:list[Any] = [
-    pytest.param(
-        textwrap.dedent("""\
-            JAMES          3.318  3.318         1
-        """),
-        GEN_MALE_PATH,
-        r'[a-zA-Z]+',
-        str.capitalize,
-        "James",
-        id="male name"
-    ),
+# def test_generate_person_dict(person_generator_stubs, mock_person_dict) -> None:
+@pytest.fixture(scope="session")
+def mock_person_dict() -> dict[str, Any]:
+    """
+    A fully populated person dictionary, built once per test session.
+    Tests must treat it as read-only.
+    """
+    return {
+        "first_name": "Kory",
+        "last_name": "Ahrns",
+        "sex": "Male",
+        "email": "kory.ahrns@fastmail.com",
+        "age": 68,
+        "job": "Retired",
+        "phone_num": "(705) 385-7324"
+    }
+
+
+class CallRecorder: # pylint: disable=too-few-public-methods
+    """
+    A plain callable to monkeypatch in place of a function. Every call is
+    appended to `calls` as (args, kwargs), or as (name, args, kwargs) when a
+    name is given, so several recorders can share one ordered `calls` list.
+    The call is answered by `respond(*args, **kwargs)` when set, otherwise by
+    `return_value`.
+    """
+
+    def __init__(self, return_value: Any = None, *,
+                 respond: Optional[Callable[..., Any]] = None,
+                 name: Optional[str] = None,
+                 calls: Optional[list[Any]] = None) -> None:
+        self.return_value = return_value
+        self.respond = respond
+        self.name = name
+        self.calls: list[Any] = [] if calls is None else calls
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs) if self.name is None else (self.name, args, kwargs))
+        if self.respond is not None:
+            return self.respond(*args, **kwargs)
+        return self.return_value
+
+
+# The generators called by generate_person_dict, each paired with the key
+# of the person dict that it produces.
+PERSON_DICT_GENERATORS: tuple[tuple[str, str], ...] = (
+    ("generate_sex", "sex"),
+    ("generate_first_name", "first_name"),
+    ("generate_last_name", "last_name"),
+    ("generate_email", "email"),
+    ("generate_age", "age"),
+    ("generate_occupation", "job"),
+    ("generate_phone_num", "phone_num"),
+)
+
+
+# Relates to pytests/test_random_person_generator_pytest.py
+# def test_generate_person_dict(person_generator_stubs, mock_person_dict) -> None:
+@pytest.fixture
+def person_generator_stubs(
+        monkeypatch: pytest.MonkeyPatch,
+        mock_person_dict: dict[str, Any]) -> list[tuple[str, tuple[Any, ...], dict[str, Any]]]:
+    """
+    Replaces every generator in PERSON_DICT_GENERATORS with a CallRecorder
+    returning the matching mock_person_dict value. Returns the list they all
+    share, recording each call as (function name, args, kwargs), in call order.
+    """
+    calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+    for func_name, person_key in PERSON_DICT_GENERATORS:
+        monkeypatch.setattr(r, func_name, CallRecorder(
+            mock_person_dict[person_key], name=func_name, calls=calls))
+    return calls
+
+
+# Relates to pytests/test_random_person_generator_pytest.py
+# def test_generate_people_list(patched_generate_person_dict, expected_batch_person, count):
+@pytest.fixture(scope="session")
+def expected_batch_person() -> dict[str, Any]:
+    """
+    A placeholder person returned by a mocked generate_person_dict,
+    built once per test session. Tests must treat it as read-only.
+    """
+    return {"id": "batch_person_data", "name": "Batchy"}
+
+
+# Relates to pytests/test_random_person_generator_pytest.py
+# def test_generate_people_list(patched_generate_person_dict, expected_batch_person, count):
+@pytest.fixture
+def patched_generate_person_dict(
+        monkeypatch: pytest.MonkeyPatch,
+        expected_batch_person: dict[str, Any]) -> CallRecorder:
+    """
+    Patches generate_person_dict with a CallRecorder returning
+    expected_batch_person. The same object is handed back on every call, so
+    it is wrapped in a read-only view to stop any caller mutating it and
+    leaking into the other entries.
+    """
+    recorder = CallRecorder(MappingProxyType(expected_batch_person))
+    monkeypatch.setattr(r, "generate_person_dict", recorder)
+    return recorder
+
+
+# Relates to pytests/test_random_person_generator_pytest.py
+# def test_parse_args(parser, cli_args, expected_args):
+@pytest.fixture(scope="session")
+def parser() -> argparse.ArgumentParser:
+    """
+    The command line parser, built once per test session. Tests call
+    parser.parse_args([...]) directly instead of patching sys.argv.
+    """
+    # pylint: disable=W0212
+    return r._build_parser()
+
+
+# Relates to pytests/test_random_person_generator_pytest.py
+# @pytest.mark.parametrize("cli_args, expected_args", TEST_PARSE_ARGS_CASES)
+# def test_parse_args(parser, cli_args, expected_args):
+TEST_PARSE_ARGS_CASES: tuple[Any, ...] = (
     pytest.param(
-        textwrap.dedent("""\
-            MARY           2.629  2.629         1
-        """),
-        GEN_FEMALE_PATH,
-        r'[a-zA-Z]+',
-        str.capitalize,
-        "Mary",
-        id="female name"
+        [],
+        {"gender": None, "min_age": DEFAULT_MIN_AGE, "max_age": DEFAULT_MAX_AGE,
+         "count": 1, "format": "oneline"},
+        id="defaults"
     ),
     pytest.param(
-        textwrap.dedent("""\
-            SMITH          1.006  1.006         1
-        """),
-        SURNAME_PATH,
-        r'[a-zA-Z]+',
-        str.capitalize,
-        "Smith",
-        id="last name"
+        ['-g', 'female',
+         '--min_age', '25',
+         '-max_age', '60',
+         '-c', '5',
+         '-f', 'json'],
+        {"gender": "female", "min_age": 25, "max_age": 60, "count": 5, "format": "json"},
+        id="all options"
     ),
     pytest.param(
-        textwrap.dedent("""\
-            Doctor
-        """),
-        JOBS_PATH,
-        r'[a-zA-Z\s-]+',
-        str.title,
-        "Doctor",
-        id="occupation"
+        ['-g', "male"],
+        {"gender": "male", "min_age": DEFAULT_MIN_AGE, "max_age": DEFAULT_MAX_AGE,
+         "count": 1, "format": "oneline"},
+        id="gender male"
     ),
     pytest.param(
-        "", # Empty content
-        DATA_EMPTY_PATH,
-        r'[a-zA-Z]+',
-        str.capitalize,
-        ValueError,
-        id="empty file"
+        ['-g', "female"],
+        {"gender": "female", "min_age": DEFAULT_MIN_AGE, "max_age": DEFAULT_MAX_AGE,
+         "count": 1, "format": "oneline"},
+        id="gender female"
     ),
-    pytest.param(
-        "12345\n67890\n", # Content with no match
-        DATA_NUMBERS_ONLY_PATH,
-        r'[a-zA-Z]+',
-        str.capitalize,
-        ValueError,
-        id="numbers in file / no match"
+)
+
+
+# Relates to pytests/test_random_person_generator_pytest.py
+# def test_generate_random_value_from_file(read_files_stub, ...):
+@pytest.fixture
+def read_files_stub(monkeypatch: pytest.MonkeyPatch) -> CallRecorder:
+    """
+    Replaces read_files_various_inputs with a CallRecorder. Set its
+    `return_value`; every call is appended to its `calls` list.
+    """
+    recorder = CallRecorder()
+    monkeypatch.setattr(r, "read_files_various_inputs", recorder)
+    return recorder
+
+
+# Relates to pytests/test_random_person_generator_pytest.py
+# def test_read_files_various_inputs(patched_open, ...):
+@pytest.fixture
+def patched_open(monkeypatch: pytest.MonkeyPatch) -> Callable[[str], list[Any]]:
+    """
+    Returns a setter that replaces builtins.open with a CallRecorder serving
+    the given fake file content from an in-memory io.StringIO (itself a
+    context manager). The setter returns the list that records each call as
+    (args, kwargs).
+    """
+    def _set_content(content: str) -> list[Any]:
+        recorder = CallRecorder(respond=lambda *args, **kwargs: io.StringIO(content))
+        monkeypatch.setattr(builtins, "open", recorder)
+        return recorder.calls
+
+    return _set_content
+
+
+@dataclass(frozen=True, slots=True)
+class ReadFileCase:
+    """One test_read_files_various_inputs case. Slotted, so it carries no per-instance __dict__."""
+    mock_file_content: str
+    file_path_arg: Path
+    regex_pattern: str
+    transform_func: Callable[[str], str]
+    expected_outcome: Any # The expected string, or the exception class to be raised
+
+
+@dataclass(frozen=True, slots=True)
+class GenerateFromFileCase:
+    """One test_generate_random_value_from_file case, slotted like ReadFileCase."""
+    generator_func: Callable[..., str]
+    generator_func_args: tuple[Any, ...]
+    expected_path: Path
+    expected_regex: str
+    expected_transform_func: Callable[[str], str]
+    mock_return_value: str
+    read_func_expected_to_be_called: bool
+
+
+# Relates to pytests/test_random_person_generator_pytest.py
+# def test_read_files_various_inputs(patched_open, case: ReadFileCase) -> None:
+# Parametrized through pytest_generate_tests below.
+def iter_read_file_various_inputs_cases() -> Iterator[Any]:
+    """Yields the test_read_files_various_inputs cases one at a time."""
+    yield from (
+        pytest.param(ReadFileCase(
+            MOCK_MALE_NAME_FILE_DATA,
+            GEN_MALE_PATH,
+            r'[a-zA-Z]+',
+            str.capitalize,
+            "James"),
+            id="male name"
+        ),
+        pytest.param(ReadFileCase(
+            MOCK_FEMALE_NAME_FILE_DATA,
+            GEN_FEMALE_PATH,
+            r'[a-zA-Z]+',
+            str.capitalize,
+            "Mary"),
+            id="female name"
+        ),
+        pytest.param(ReadFileCase(
+            MOCK_SURNAME_FILE_DATA,
+            SURNAME_PATH,
+            r'[a-zA-Z]+',
+            str.capitalize,
+            "Smith"),
+            id="last name"
+        ),
+        pytest.param(ReadFileCase(
+            MOCK_JOB_FILE_DATA,
+            JOBS_PATH,
+            r'[a-zA-Z\s-]+',
+            str.title,
+            "Doctor"),
+            id="occupation"
+        ),
+        pytest.param(ReadFileCase(
+            "", # Empty content
+            DATA_EMPTY_PATH,
+            r'[a-zA-Z]+',
+            str.capitalize,
+            ValueError),
+            id="empty file"
+        ),
+        pytest.param(ReadFileCase(
+            "12345\n67890\n", # Content with no match
+            DATA_NUMBERS_ONLY_PATH,
+            r'[a-zA-Z]+',
+            str.capitalize,
+            ValueError),
+            id="numbers in file / no match"
+        )
     )
-]
+
 
 # Relates to pytests/test_random_person_generator_pytest.py
-# @pytest.mark.parametrize(
-#     ("generator_func, generator_func_args, expected_path, expected_regex,"
-#     "expected_transform_func, mock_return_value, read_func_expected_to_be_called"),
-#     TEST_GENERATE_RANDOM_VALUE_FROM_FILE
-# )
-# def test_generate_random_value_from_file(
-TEST_GENERATE_RANDOM_VALUE_FROM_FILE: list[Any] = [
-    # --- Cases for generate_first_name ---
-    pytest.param(
-        r.generate_first_name, ('Male',), GEN_MALE_PATH, r'[a-zA-Z]+',
-        str.capitalize, "James", True, id="first_name_male_gender"
-    ),
-    pytest.param(
-        r.generate_first_name, ('Female',), GEN_FEMALE_PATH, r'[a-zA-Z]+',
-        str.capitalize, "Mary", True, id="first_name_female_gender"
-    ),
-    # Add a case for unexpected gender if generate_first_name handles it
-    # (defaults to female path in your code)
-    pytest.param(
-        r.generate_first_name, ('Unknown',), GEN_MALE_PATH, r'[a-zA-Z]+',
-        str.capitalize, "Alex", True, id="first_name_unknown_gender_defaults_to_male"
-    ),
+# def test_generate_random_value_from_file(read_files_stub, case: GenerateFromFileCase) -> None:
+# Parametrized through pytest_generate_tests below.
+def iter_generate_random_value_from_file_cases() -> Iterator[Any]:
+    """Yields the test_generate_random_value_from_file cases one at a time."""
+    yield from (
+        # --- Cases for generate_first_name ---
+        pytest.param(GenerateFromFileCase(
+            r.generate_first_name, ('Male',), GEN_MALE_PATH, r'[a-zA-Z]+',
+            str.capitalize, "James", True), id="first_name_male_gender"
+        ),
+        pytest.param(GenerateFromFileCase(
+            r.generate_first_name, ('Female',), GEN_FEMALE_PATH, r'[a-zA-Z]+',
+            str.capitalize, "Mary", True), id="first_name_female_gender"
+        ),
+        # Add a case for unexpected gender if generate_first_name handles it
+        # (defaults to female path in your code)
+        pytest.param(GenerateFromFileCase(
+            r.generate_first_name, ('Unknown',), GEN_MALE_PATH, r'[a-zA-Z]+',
+            str.capitalize, "Alex", True), id="first_name_unknown_gender_defaults_to_male"
+        ),
 
-    # --- Cases for generate_last_name ---
-    pytest.param(
-        r.generate_last_name, (), SURNAME_PATH, r'[a-zA-Z]+',
-        str.capitalize, "Catledge", True, id="last_name_generation"
-    ),
+        # --- Cases for generate_last_name ---
+        pytest.param(GenerateFromFileCase(
+            r.generate_last_name, (), SURNAME_PATH, r'[a-zA-Z]+',
+            str.capitalize, "Catledge", True), id="last_name_generation"
+        ),
 
-    # --- Cases for generate_occupation ---
-    pytest.param(
-        r.generate_occupation, (5,), JOBS_PATH, r'^[a-zA-Z\s]+',
-    str.title, "Child", False, id="occupation_child_age_group"
-    ),
-    pytest.param(
-        r.generate_occupation, (40,), JOBS_PATH, r'^[a-zA-Z\s-]+',
-        str.title, "Software Engineer", True, id="occupation_adult_age_group"
-    ),
-    pytest.param(
-        r.generate_occupation, (81,), JOBS_PATH, r'^[a-zA-Z\s]+',
-        str.title, "Retired", False, id="occupation_senior_age_group"
-    ),
-    # Add a case for unexpected age_group if generate_occupation handles it
-    # (e.g., defaults to general)
+        # --- Cases for generate_occupation ---
+        pytest.param(GenerateFromFileCase(
+            r.generate_occupation, (5,), JOBS_PATH, r'^[a-zA-Z\s]+',
+            str.title, "Child", False), id="occupation_child_age_group"
+        ),
+        pytest.param(GenerateFromFileCase(
+            r.generate_occupation, (40,), JOBS_PATH, r'^[a-zA-Z\s-]+',
+            str.title, "Software Engineer", True), id="occupation_adult_age_group"
+        ),
+        pytest.param(GenerateFromFileCase(
+            r.generate_occupation, (81,), JOBS_PATH, r'^[a-zA-Z\s]+',
+            str.title, "Retired", False), id="occupation_senior_age_group"
+        ),
+        # Add a case for unexpected age_group if generate_occupation handles it
+        # (e.g., defaults to general)
+        pytest.param(GenerateFromFileCase(
+            r.generate_occupation, (17,), JOBS_PATH, r'^[a-zA-Z\s]+',
+            str.title, "Child", False), id="occupation_unknown_age_group_defaults_to_general"
+        ),
+    )
+
+
+# Tests whose cases are produced by a generator at collection time rather
+# than imported into the test module as prebuilt module-level lists.
+# Maps test function name -> (argnames, case generator).
+LAZY_PARAMETRIZE_CASES: dict[str, tuple[str, Callable[[], Iterator[Any]]]] = {
+    "test_read_files_various_inputs": (
+        "case",
+        iter_read_file_various_inputs_cases
+    ),
+    "test_generate_random_value_from_file": (
+        "case",
+        iter_generate_random_value_from_file_cases
+    ),
+}
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrizes the tests listed in LAZY_PARAMETRIZE_CASES from their case generators."""
+    lazy_cases = LAZY_PARAMETRIZE_CASES.get(metafunc.function.__name__)
+    if lazy_cases is not None:
+        argnames, iter_cases = lazy_cases
+        # The cases are only built here, when the requesting test is collected
+        metafunc.parametrize(argnames, tuple(iter_cases()))
+
+
+# Relates to pytests/test_random_person_generator_pytest.py
+# @pytest.mark.parametrize("args, expected_error_message", TEST_VALIDATE_ARGS_CASES)
+# def test_validate_args(args, expected_error_message, capfd):
+# (count, min_age, max_age, expected_error_message, id); a None message means valid
+_RAW_VALIDATE_ARGS_CASES: tuple[tuple[int, int, int, Optional[str], str], ...] = (
+    (1, 18, 60, None, "valid input"),
+    (0, 10, 85, "Count must be a positive integer", "when count==0"),
+    (-200, 10, 85, "Count must be a positive integer", "when count==-200"),
+    (1, -10, 85, "Minimum age cannot be less than zero", "when min_age==-10"),
+    (1, 85, 10, "Minimum age cannot be greater than maximum age",
+     "when min_age==85 and max_age==10"),
+    # Both count and age range are invalid: only the first error is reported
+    (0, 50, 40, "Count must be a positive integer.", "multiple errors prioritization"),
+)
+# Every message _validate_args can report; a failing case must show only its own
+VALIDATE_ARGS_ERROR_MESSAGES: tuple[str, ...] = (
+    "Count must be a positive integer",
+    "Minimum age cannot be greater than maximum age",
+    "Minimum age cannot be less than zero",
+)
+TEST_VALIDATE_ARGS_CASES: tuple[Any, ...] = tuple(
     pytest.param(
-        r.generate_occupation, (17,), JOBS_PATH, r'^[a-zA-Z\s]+',
-        str.title, "Child", False, id="occupation_unknown_age_group_defaults_to_general"
-    ),
-]
+        SimpleNamespace(count=count, min_age=min_age, max_age=max_age, gender=None),
+        expected_error_message,
+        id=case_id
+    )
+    for count, min_age, max_age, expected_error_message, case_id in _RAW_VALIDATE_ARGS_CASES
+)
+
+
+# Relates to pytests/test_random_person_generator_pytest.py
+# def test_get_formatted_display_strings(people_data, format_args, ...) -> None:
+@pytest.fixture(scope="module")
+def format_args(request: pytest.FixtureRequest) -> SimpleNamespace:
+    """
+    The parsed-arguments namespace for the format name given through indirect
+    parametrization; built once per format per module and shared by its cases.
+    """
+    return SimpleNamespace(format=request.param)
 
 
 # Relates to pytests/test_random_person_generator_pytest.py
 # @pytest.mark.parametrize(
-#     "people_data, format, expected_person_display_block",
-#     TEST_FORMATTED_DISPLAY_STRINGS_CASES
+#     "people_data, format_args, expected_person_display_block",
+#     TEST_FORMATTED_DISPLAY_STRINGS_CASES, indirect=["format_args"]
 # )
-# def test_get_formatted_display_strings(self, mocker,
-#         people_data, format, expected_person_display_block) -> None:
-TEST_FORMATTED_DISPLAY_STRINGS_CASES: list[Any] = [
+# def test_get_formatted_display_strings(
+#         people_data, format_args, expected_person_display_block) -> None:
+TEST_FORMATTED_DISPLAY_STRINGS_CASES: tuple[Any, ...] = (
     pytest.param(
         [],
         "oneline",
@@ -352,19 +628,19 @@ Email          : cyril.gearon@aol.com
         ],
         id="json_3person"
     ),
-]
+)
 
 
 # NEW CODE - UNDER CONSTRUCTION
 
 # Relates to pytests/test_display_formatters_pytest.py
+# Paired with format_person_oneline_display in FORMATTER_CASES, used by:
 # @pytest.mark.parametrize(
-#     "people_data, expected_person_display_block",
-#     TEST_FORMAT_PERSON_ONELINE_CASES
+#     "formatter, people_data, expected_person_display_block",
+#     FORMATTER_CASES
 # )
-# def test_format_person_oneline_display(self, mocker,
-#         people_data, expected_person_display_block) -> None:
-TEST_FORMAT_PERSON_ONELINE_CASES: list[Any] = [
+# def test_format_person_display(formatter, people_data, expected_person_display_block) -> None:
+TEST_FORMAT_PERSON_ONELINE_CASES: tuple[Any, ...] = (
     pytest.param(
         [],
         [],
@@ -407,17 +683,17 @@ Burton Cothron        14 Male   Child                         (160) 352-2141 bur
         ],
         id="3person"
     ),
-]
+)
 
 
 # Relates to pytests/test_display_formatters_pytest.py
+# Paired with format_person_table_display in FORMATTER_CASES, used by:
 # @pytest.mark.parametrize(
-#     "people_data, expected_person_display_block",
-#     TEST_FORMAT_PERSON_TABLE_CASES
+#     "formatter, people_data, expected_person_display_block",
+#     FORMATTER_CASES
 # )
-# def test_format_person_table_display(self, mocker,
-#         people_data, expected_person_display_block) -> None:
-TEST_FORMAT_PERSON_TABLE_CASES: list[Any] = [
+# def test_format_person_display(formatter, people_data, expected_person_display_block) -> None:
+TEST_FORMAT_PERSON_TABLE_CASES: tuple[Any, ...] = (
     pytest.param(
         [],
         [],
@@ -501,17 +777,17 @@ Email          : cyril.gearon@aol.com
         ],
         id="3person"
     ),
-]
+)
 
 
 # Relates to pytests/test_display_formatters_pytest.py
+# Paired with format_person_dict_display in FORMATTER_CASES, used by:
 # @pytest.mark.parametrize(
-#     "people_data, expected_person_display_block",
-#     TEST_FORMAT_PERSON_DICT_CASES
+#     "formatter, people_data, expected_person_display_block",
+#     FORMATTER_CASES
 # )
-# def test_format_person_dict_display(self, mocker,
-#         people_data, expected_person_display_block) -> None:
-TEST_FORMAT_PERSON_DICT_CASES: list[Any] = [
+# def test_format_person_display(formatter, people_data, expected_person_display_block) -> None:
+TEST_FORMAT_PERSON_DICT_CASES: tuple[Any, ...] = (
     pytest.param(
         [],
         ['[]'],
@@ -548,17 +824,17 @@ TEST_FORMAT_PERSON_DICT_CASES: list[Any] = [
         ],
         id="3person"
     ),
-]
+)
 
 
 # Relates to pytests/test_display_formatters_pytest.py
+# Paired with format_person_json_display in FORMATTER_CASES, used by:
 # @pytest.mark.parametrize(
-#     "people_data, expected_person_display_block",
-#     TEST_FORMAT_PERSON_JSON_CASES
+#     "formatter, people_data, expected_person_display_block",
+#     FORMATTER_CASES
 # )
-# def test_format_person_json_display(self, mocker,
-#         people_data, expected_person_display_block) -> None:
-TEST_FORMAT_PERSON_JSON_CASES: list[Any] = [
+# def test_format_person_display(formatter, people_data, expected_person_display_block) -> None:
+TEST_FORMAT_PERSON_JSON_CASES: tuple[Any, ...] = (
     pytest.param(
         [],
         ['[]'],
@@ -595,4 +871,4 @@ TEST_FORMAT_PERSON_JSON_CASES: list[Any] = [
         ],
         id="3person"
     ),
-]
+)
@@ -14,72 +14,31 @@ from .conftest import TEST_FORMAT_PERSON_TABLE_CASES
 from .conftest import TEST_FORMAT_PERSON_DICT_CASES
 from .conftest import TEST_FORMAT_PERSON_JSON_CASES
 
-
-class TestDisplayFormatters: # No inheritance from unittest.TestCase
-    """
-    A test suite for the formatting functions in `display_formatters.py`.
-
-    This class contains isolated unit tests for `format_person_oneline_display`,
-    `format_person_table_display`, `format_person_dict_display`, and
-    `format_person_json_display`. It uses pytest's parametrization to test
-    a wide range of inputs and expected outputs for each formatter.
-    """
-
-    @pytest.mark.parametrize(
-        "people_data, expected_person_display_block", 
-        TEST_FORMAT_PERSON_ONELINE_CASES
-    )
-    def test_format_person_oneline_display(
-        self, people_data, expected_person_display_block) -> None:
-        """
-        Test suite for functions within the display_formatters module using pytest.
-        """
-        # pylint: disable=W0212
-        actual_display_block = r.format_person_oneline_display(people_data)
-
-        assert actual_display_block == expected_person_display_block
-
-
-    @pytest.mark.parametrize(
-        "people_data, expected_person_display_block", 
-        TEST_FORMAT_PERSON_TABLE_CASES
+# Each formatter paired with its case table, flattened into one parametrize list
+# with ids of the form "<formatter>-<case id>".
+FORMATTER_CASES = tuple(
+    pytest.param(formatter, *case.values, marks=case.marks,
+                 id=f"{formatter.__name__}-{case.id}")
+    for formatter, cases in (
+        (r.format_person_oneline_display, TEST_FORMAT_PERSON_ONELINE_CASES),
+        (r.format_person_table_display, TEST_FORMAT_PERSON_TABLE_CASES),
+        (r.format_person_dict_display, TEST_FORMAT_PERSON_DICT_CASES),
+        (r.format_person_json_display, TEST_FORMAT_PERSON_JSON_CASES),
     )
-    def test_format_person_table_display(
-        self, people_data, expected_person_display_block) -> None:
-        """
-        Test suite for functions within the display_formatters module using pytest.
-        """
-        # pylint: disable=W0212
-        actual_display_block = r.format_person_table_display(people_data)
+    for case in cases
+)
 
-        assert actual_display_block == expected_person_display_block
 
+@pytest.mark.parametrize(
+    "formatter, people_data, expected_person_display_block",
+    FORMATTER_CASES
+)
+def test_format_person_display(formatter, people_data, expected_person_display_block) -> None:
+    """
+    Tests each formatter in `display_formatters.py` (`format_person_oneline_display`,
+    `format_person_table_display`, `format_person_dict_display` and
+    `format_person_json_display`) against its own table of inputs and expected outputs.
+    """
+    actual_display_block = formatter(people_data)
 
-    @pytest.mark.parametrize(
-        "people_data, expected_person_display_block", 
-        TEST_FORMAT_PERSON_DICT_CASES
-    )
-    def test_format_person_dict_display(
-        self, people_data, expected_person_display_block) -> None:
-        """
-        Test suite for functions within the display_formatters module using pytest.
-        """
-        # pylint: disable=W0212
-        actual_display_block = r.format_person_dict_display(people_data)
-
-        assert actual_display_block == expected_person_display_block
-
-
-    @pytest.mark.parametrize(
-        "people_data, expected_person_display_block", 
-        TEST_FORMAT_PERSON_JSON_CASES
-    )
-    def test_format_person_json_display(
-        self, people_data, expected_person_display_block) -> None:
-        """
-        Test suite for functions within the display_formatters module using pytest.
-        """
-        # pylint: disable=W0212
-        actual_display_block = r.format_person_json_display(people_data)
-
-        assert actual_display_block == expected_person_display_block
+    assert actual_display_block == expected_person_display_block